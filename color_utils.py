@@ -0,0 +1,168 @@
+import colorsys # Python 표준 라이브러리
+import functools
+import numpy as np
+
+try:
+    import numba # 선택 의존성: 설치되어 있으면 HSV 계산을 JIT 컴파일
+except ImportError:
+    numba = None
+
+# 0-255 정수를 두 자리 대문자 HEX 문자열로 바꾸는 조회 표
+_HEX_BYTE = tuple(f'{i:02X}' for i in range(256))
+
+# ASCII 코드를 HEX 숫자 값(0-15)으로 바꾸는 역방향 조회 표 (대소문자 모두 지원)
+_UNHEX = bytearray(256)
+for _i, _c in enumerate(b'0123456789ABCDEF'):
+    _UNHEX[_c] = _i
+    _UNHEX[_c | 0x20] = _i
+del _i, _c
+
+# ----------------------------
+# CSS/HTML 스타일 및 유틸리티
+# ----------------------------
+def _hex_rgb(hex_code):
+    """'#RRGGBB' 형식의 HEX 코드를 (R, G, B) 정수 튜플(0-255)로 변환합니다."""
+    # '#' 유무와 관계없이 마지막 6자리가 RRGGBB (입력은 상위에서 검증됨)
+    b = hex_code[-6:].encode('ascii')
+    return (
+        _UNHEX[b[0]] << 4 | _UNHEX[b[1]],
+        _UNHEX[b[2]] << 4 | _UNHEX[b[3]],
+        _UNHEX[b[4]] << 4 | _UNHEX[b[5]],
+    )
+
+def _rgb_hex(r, g, b):
+    """(R, G, B) 정수(0-255)를 '#RRGGBB' 형식의 HEX 코드로 변환합니다."""
+    return '#' + _HEX_BYTE[r] + _HEX_BYTE[g] + _HEX_BYTE[b]
+
+def is_light_color(hex_code):
+    """색상의 밝기를 판단하여 텍스트 색상을 결정합니다 (명암 대비)."""
+    # HEX를 RGB로 변환 (0-255)
+    r, g, b = _hex_rgb(hex_code)
+    
+    # 휘도 계산 (Luminance): 0.2126/0.7152/0.0722 계수를 256배한 정수(54/183/19) 사용
+    # 기준값 35904 = 0.55 * 255 * 256
+    return (54 * r + 183 * g + 19 * b) > 35904
+
+# 색상 상자 HTML의 고정된 부분 (호출마다 다시 만들지 않도록 모듈 수준에 둠)
+_BOX_T1 = '<div style="background-color:'
+_BOX_T2 = ';color:'
+_BOX_T3 = (
+    ';padding:15px;border-radius:5px;text-align:center;margin-bottom:10px;'
+    'box-shadow:2px 2px 5px #888888;font-weight:bold;">'
+)
+_BOX_T4 = '</div>'
+
+def get_color_box_html(hex_code, label):
+    """색상 코드와 이름을 표시하는 HTML 상자를 생성합니다."""
+    color = '#FFFFFF' if is_light_color(hex_code) else '#000000'
+    return ''.join((_BOX_T1, hex_code, _BOX_T2, color, _BOX_T3, label, '<br>', hex_code.upper(), _BOX_T4))
+
+# ----------------------------
+# 색상 조화 계산 로직 (HSV 기반)
+# ----------------------------
+# Hue 구간(0-5)별 (R, G, B) 채널이 (V, P, Q, T) 중 어느 값을 쓰는지 나타내는 표
+# 구간 0: (V, T, P), 1: (Q, V, P), 2: (P, V, T), 3: (P, Q, V), 4: (T, P, V), 5: (V, P, Q)
+_HSV_ORDER = np.array([
+    (0, 3, 1),
+    (2, 0, 1),
+    (1, 0, 3),
+    (1, 2, 0),
+    (3, 1, 0),
+    (0, 1, 2),
+])
+
+# 조화 색상별 Hue 이동 각도 (lru_cache 키로 쓰이도록 튜플로 고정)
+_COMPLEMENTARY_DEG = (180.0,)
+_ANALOGOUS_DEG = (-30.0, 30.0)
+_TRIADIC_DEG = (120.0, 240.0)
+# 보색/유사색/삼각형 보색을 한 번에 계산할 때의 각도 (-30, +30, +120, +240, 180)
+_PALETTE_DEG = _ANALOGOUS_DEG + _TRIADIC_DEG + _COMPLEMENTARY_DEG
+
+def _harmony_rgb_vectorized(h, s, v, degrees):
+    """기준 HSV의 Hue를 degrees(배열)만큼 이동한 RGB(0-255, uint8) 배열 (N, 3)을 반환합니다."""
+    # Hue 값 계산: 모든 각도를 한 번에 0.0 ~ 1.0 범위로 변환 후 더하고 modulo 연산
+    hs = (h + degrees / 360.0) % 1.0
+    
+    # HSV를 다시 RGB (0-1.0)로 변환 (colorsys.hsv_to_rgb와 같은 구간별 공식을 벡터화)
+    # 구간별 조건 분기 대신 _HSV_ORDER 표를 인덱싱하여 채널 값을 고름
+    sector = np.floor(hs * 6.0)
+    f = hs * 6.0 - sector
+    i = sector.astype(int) % 6
+    p = np.full_like(hs, v * (1.0 - s))
+    q = v * (1.0 - s * f)
+    t = v * (1.0 - s * (1.0 - f))
+    vpqt = np.stack((np.full_like(hs, v), p, q, t), axis=1)
+    rgb_new = np.take_along_axis(vpqt, _HSV_ORDER[i], axis=1)
+    
+    # RGB (0-255)로 되돌림
+    # (np.rint는 round()와 같은 half-even 반올림을 C 루프에서 수행하며, 임시 배열 없이 제자리 계산)
+    rgb_new *= 255
+    return np.rint(rgb_new, out=rgb_new).astype(np.uint8)
+
+def _harmony_rgb_loop(h, s, v, degrees):
+    """_harmony_rgb_vectorized와 같은 계산을 각도별 루프로 수행합니다 (numba JIT용)."""
+    out = np.empty((degrees.shape[0], 3), dtype=np.uint8)
+    vpqt = np.empty(4)
+    for k in range(degrees.shape[0]):
+        hk = (h + degrees[k] / 360.0) % 1.0
+        sector = np.floor(hk * 6.0)
+        f = hk * 6.0 - sector
+        i = int(sector) % 6
+        vpqt[0] = v
+        vpqt[1] = v * (1.0 - s)
+        vpqt[2] = v * (1.0 - s * f)
+        vpqt[3] = v * (1.0 - s * (1.0 - f))
+        for c in range(3):
+            out[k, c] = np.uint8(np.rint(vpqt[_HSV_ORDER[i, c]] * 255))
+    return out
+
+# numba가 있으면 JIT 컴파일된 루프를, 없으면 NumPy 벡터화 구현을 사용
+# (cache=True로 컴파일 결과를 디스크에 저장하여 다음 실행부터 JIT 비용을 없앰)
+if numba is not None:
+    _harmony_rgb = numba.njit(cache=True)(_harmony_rgb_loop)
+else:
+    _harmony_rgb = _harmony_rgb_vectorized
+
+@functools.lru_cache(maxsize=1024)
+def get_harmony_colors(hex_code, degrees: tuple[float, ...]):
+    """
+    HEX 코드를 입력받아 지정된 각도(degrees)만큼 Hue를 이동하여
+    새로운 HEX 코드 목록을 반환합니다.
+    (결과는 캐시되므로 degrees는 튜플로 전달하고, 반환값은 튜플입니다.)
+    """
+    # 1. HEX를 RGB (0-1.0)로 정규화
+    r_255, g_255, b_255 = _hex_rgb(hex_code)
+    r, g, b = r_255 / 255.0, g_255 / 255.0, b_255 / 255.0
+    
+    # 2. RGB를 HSV로 변환
+    h, s, v = colorsys.rgb_to_hsv(r, g, b)
+    
+    # 3. 모든 각도만큼 Hue를 이동하여 RGB (0-255)로 변환
+    rgb_255_new = _harmony_rgb(h, s, v, np.asarray(degrees, dtype=np.float64))
+    
+    # 4. 최종 HEX 코드로 변환
+    return tuple(_rgb_hex(r, g, b) for r, g, b in rgb_255_new.tolist())
+
+# 보색 계산 (Complementary: 180도)
+@functools.lru_cache(maxsize=1024)
+def get_complementary_hex_simple(hex_code):
+    return get_harmony_colors(hex_code, _COMPLEMENTARY_DEG)[0]
+
+# 보색은 HSV 색상환의 180도 회전이므로 colormath(Lab) 경로 없이 colorsys 구현을 그대로 사용
+get_complementary_hex = get_complementary_hex_simple
+
+# 유사색 계산 (Analogous: 양쪽으로 30도)
+@functools.lru_cache(maxsize=1024)
+def get_analogous_hex(hex_code):
+    return get_harmony_colors(hex_code, _ANALOGOUS_DEG)
+
+# 삼각형 보색 계산 (Triadic: 120도, 240도)
+@functools.lru_cache(maxsize=1024)
+def get_triadic_hex(hex_code):
+    return get_harmony_colors(hex_code, _TRIADIC_DEG)
+
+# 전체 팔레트 계산: 입력 색상의 HSV 변환을 한 번만 하고 모든 각도를 함께 이동
+def get_palette_hex(hex_code):
+    """(보색, 유사색 튜플, 삼각형 보색 튜플)을 반환합니다."""
+    hexes = get_harmony_colors(hex_code, _PALETTE_DEG)
+    return hexes[4], hexes[0:2], hexes[2:4]